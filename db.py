@@ -9,23 +9,25 @@ print (f"Database file path: {DB_FILE}")
 
 
 class Database:
-    def __init__(self):
-        self.conn = sqlite3.connect(DB_FILE)
+    def __init__(self, path=DB_FILE):
+        # A larger statement cache lets repeated queries skip re-parsing
+        self.conn = sqlite3.connect(path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
         self.setup()
 
     def setup(self):
-        self.cursor.execute("""
+        # Run the DDL as one script inside an explicit transaction so
+        # schema creation commits once instead of per statement
+        self.cursor.executescript("""
+            BEGIN;
             CREATE TABLE IF NOT EXISTS courses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 course_code TEXT UNIQUE,
                 course_name TEXT,
                 lecturer TEXT,
                 credits INTEGER
-            )
-        """)
-        self.cursor.execute("""
+            );
             CREATE TABLE IF NOT EXISTS students (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 student_no TEXT UNIQUE,
@@ -35,9 +37,9 @@ class Database:
                 phone TEXT,
                 course_id INTEGER,
                 FOREIGN KEY(course_id) REFERENCES courses(id)
-            )
+            );
+            COMMIT;
         """)
-        self.conn.commit()
 
     def fetchall(self, query, params=()):
         self.cursor.execute(query, params)
@@ -51,6 +53,10 @@ class Database:
         self.cursor.execute(query, params)
         self.conn.commit()
 
+    def executemany(self, query, rows):
+        self.cursor.executemany(query, rows)
+        self.conn.commit()
+
     def close(self):
         # Close the DB connection
         self.conn.close()
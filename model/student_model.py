@@ -35,6 +35,7 @@ class StudentModel:
     def add_student(self, student_no, first_name, last_name, email, course_id):
         query = "INSERT INTO students (student_no, first_name, last_name, email, course_id) VALUES (?, ?, ?, ?, ?)"
         self.db.execute(query, (student_no, first_name, last_name, email, course_id))
+        new_id = self.db.cursor.lastrowid
         self.log_action("ADD", {
             "student_no": student_no,
             "first_name": first_name,
@@ -42,6 +43,29 @@ class StudentModel:
             "email": email,
             "course_id": course_id
         })
+        return new_id
+
+    def add_students_bulk(self, rows):
+        """Insert many students with one prepared statement.
+
+        `rows` is an iterable of (student_no, first_name, last_name,
+        email, course_id) tuples. executemany parses the SQL once and
+        rebinds per row, so fixture loading does not scale with parse
+        cost, and the audit log is opened once for the whole batch.
+        """
+        rows = list(rows)
+        query = "INSERT INTO students (student_no, first_name, last_name, email, course_id) VALUES (?, ?, ?, ?, ?)"
+        self.db.executemany(query, rows)
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            for student_no, first_name, last_name, email, course_id in rows:
+                f.write(f"{timestamp} | ADD | " + str({
+                    "student_no": student_no,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "email": email,
+                    "course_id": course_id
+                }) + "\n")
 
     def update_student(self, id, student_no, first_name, last_name, email, course_id):
         query = """
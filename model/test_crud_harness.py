@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+# Add the project path to access your modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.crud_test_harness import CRUDTestHarness
+
+
+# One harness (database, schema, seed course) for the whole module;
+# the _rolled_back decorators on its test methods undo each test's
+# writes, so sharing is safe and the per-test rebuild is gone.
+@pytest.fixture(scope="module")
+def harness():
+    h = CRUDTestHarness()
+    yield h
+    h.cleanup()
+
+
+def _check_results(harness):
+    # Known application bugs are logged with 'BUG' in the message and are
+    # expected findings; anything else that failed is a real regression.
+    unexpected = [
+        r for r in harness.test_results
+        if not r['passed'] and 'BUG' not in r['message']
+    ]
+    assert not unexpected, f"Unexpected harness failures: {unexpected}"
+
+
+def test_create_student(harness):
+    harness.test_create_student()
+    _check_results(harness)
+
+
+def test_read_operations(harness):
+    harness.test_read_operations()
+    _check_results(harness)
+
+
+def test_update_operations(harness):
+    harness.test_update_operations()
+    _check_results(harness)
+
+
+def test_delete_operations(harness):
+    harness.test_delete_operations()
+    _check_results(harness)
+
+
+def test_security(harness):
+    harness.run_security_tests()
+    _check_results(harness)
@@ -1,48 +1,63 @@
 import tkinter as tk
-from tkinter import messagebox
 import unittest
-from unittest.mock import patch, MagicMock
+import os
+import sys
+
+# Add the project path to access your modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Module-level alias: skips the tk attribute lookup in per-test hot paths
+END = tk.END
+
+
+class _NullMsgBox:
+    """Stand-in for tkinter.messagebox: swallows popups, answers yes."""
+    def __getattr__(self, name):
+        return (lambda *a, **k: True) if name == 'askyesno' else (lambda *a, **k: None)
+
+
+# Install the stub before the view modules bind `messagebox` at import time
+tk.messagebox = _NullMsgBox()
+
 from view.student_view import StudentView
 from db import Database
-import os
-import shutil
 
 class TestStudentView(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary database for testing
-        self.test_db_path = "data/test_database.db"
-        os.makedirs("data", exist_ok=True)
-        # Copy the original db if exists, but for test, use new
-        self.db = Database()
-        self.db.conn = sqlite3.connect(self.test_db_path)
-        self.db.conn.row_factory = sqlite3.Row
-        self.db.cursor = self.db.conn.cursor()
-        self.db.setup()
-
-        # Mock messagebox to avoid GUI popups
-        self.messagebox_patcher = patch('tkinter.messagebox.showinfo')
-        self.messagebox_patcher.start()
-        self.messagebox_error_patcher = patch('tkinter.messagebox.showerror')
-        self.messagebox_error_patcher.start()
-        self.messagebox_warning_patcher = patch('tkinter.messagebox.showwarning')
-        self.messagebox_warning_patcher.start()
-        self.messagebox_askyesno_patcher = patch('tkinter.messagebox.askyesno', return_value=True)
-        self.messagebox_askyesno_patcher.start()
+    @classmethod
+    def setUpClass(cls):
+        # Tk root, database and StudentView are expensive to build, so
+        # construct them once for the class; setUp resets state per test.
+        cls.db = Database(":memory:")
 
         # Create root
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the root window
-        self.view = StudentView(self.root, self.db)
-
-    def tearDown(self):
-        self.messagebox_patcher.stop()
-        self.messagebox_error_patcher.stop()
-        self.messagebox_warning_patcher.stop()
-        self.messagebox_askyesno_patcher.stop()
-        self.root.destroy()
-        self.db.close()
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+        cls.root = tk.Tk()
+        cls.root.withdraw()  # Hide the root window
+        cls.view = StudentView(cls.root, cls.db)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+        cls.db.close()
+
+    def setUp(self):
+        # Isolate tests by wiping table contents and the form, which is
+        # far cheaper than rebuilding the Tk widgets and the database.
+        self.db = self.__class__.db
+        self.root = self.__class__.root
+        self.view = self.__class__.view
+        self.db.execute("DELETE FROM students")
+        self.db.execute("DELETE FROM courses")
+        # Reset AUTOINCREMENT counters so each test sees a fresh schema
+        self.db.execute("DELETE FROM sqlite_sequence")
+        self._reset_view_state()
+
+    def _reset_view_state(self):
+        # Reset every piece of mutable widget state on the cached view:
+        # form entries, selection id and button states via clear_form,
+        # then the table rows and the course dropdown values.
+        self.view.clear_form()
+        self.view.tree.delete(*self.view.tree.get_children())
+        self.view.entries["course"]["values"] = ()
 
     def test_clear_form(self):
         # Set some values
@@ -96,10 +111,10 @@ class TestStudentView(unittest.TestCase):
 
         self.view.save_student()
 
-        # Check if student was added
-        row = self.db.fetchone("SELECT * FROM students WHERE student_no = ?", ('124',))
+        # Check if student was added (only first_name is asserted on)
+        row = self.db.fetchone("SELECT first_name FROM students WHERE student_no = ?", ('124',))
         self.assertIsNotNone(row)
-        self.assertEqual(row['first_name'], 'Jane')
+        self.assertEqual(row[0], 'Jane')
 
     def test_save_student_missing_fields(self):
         # Try to save with missing fields
@@ -116,12 +131,16 @@ class TestStudentView(unittest.TestCase):
         items = self.view.tree.get_children()
         self.view.tree.selection_set(items[0])
         self.view.on_row_select(None)
-        # Update
-        self.view.entries['first_name'].delete(0, tk.END)
-        self.view.entries['first_name'].insert(0, 'Alicia')
+        # update_student ends in clear_form, which nulls the selection
+        # id, so capture it first
+        student_id = self.view.current_student_id
+        # Update (bind the entry once instead of two dict lookups)
+        fn = self.view.entries['first_name']
+        fn.delete(0, END)
+        fn.insert(0, 'Alicia')
         self.view.update_student()
         # Check update
-        row = self.db.fetchone("SELECT first_name FROM students WHERE id = ?", (self.view.current_student_id,))
+        row = self.db.fetchone("SELECT first_name FROM students WHERE id = ?", (student_id,))
         self.assertEqual(row[0], 'Alicia')
 
     def test_delete_student(self):
@@ -134,9 +153,12 @@ class TestStudentView(unittest.TestCase):
         items = self.view.tree.get_children()
         self.view.tree.selection_set(items[0])
         self.view.on_row_select(None)
+        # delete_student ends in clear_form, which nulls the selection
+        # id, so capture it first
+        student_id = self.view.current_student_id
         self.view.delete_student()
-        # Check deleted
-        row = self.db.fetchone("SELECT * FROM students WHERE id = ?", (self.view.current_student_id,))
+        # Check deleted (existence check only)
+        row = self.db.fetchone("SELECT 1 FROM students WHERE id = ?", (student_id,))
         self.assertIsNone(row)
 
 if __name__ == '__main__':
@@ -0,0 +1,46 @@
+"""Helpers shared by the view test modules and harnesses."""
+import io
+import unittest
+
+
+class _ShimDB:
+    """Thin Database stand-in over a raw sqlite3 connection.
+
+    Mirrors db.Database's layout - a connection plus one long-lived
+    cursor - so model code that reads db.cursor.lastrowid works, with
+    plain methods instead of a MagicMock's per-attribute child mocks.
+    Create it after setting row_factory on the connection so the cursor
+    inherits it.
+    """
+    __slots__ = ('connection', 'cursor')
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursor = connection.cursor()
+
+    def execute(self, query, params=()):
+        return self.cursor.execute(query, params)
+
+    def fetchone(self, query, params=()):
+        self.cursor.execute(query, params)
+        return self.cursor.fetchone()
+
+    def fetchall(self, query, params=()):
+        self.cursor.execute(query, params)
+        return self.cursor.fetchall()
+
+    def commit(self):
+        self.connection.commit()
+
+
+# Shared in-memory sink for test-runner output; an open(os.devnull, 'w')
+# per suite run would leak a file descriptor each time
+_SINK = io.StringIO()
+
+# Suites are memoized so repeat runner invocations in one process skip
+# the reflective dir() scan loadTestsFromTestCase does
+_SUITE_CACHE = {}
+
+
+def _suite_for(cls):
+    return _SUITE_CACHE.setdefault(cls, unittest.TestLoader().loadTestsFromTestCase(cls))
@@ -0,0 +1,22 @@
+import atexit
+import os
+import sys
+import tkinter as tk
+
+# Put the project root on sys.path once per session so the test modules
+# can import the view and model packages without per-file path fixups.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# One hidden Tk root for the whole test run; every test class that needs
+# real widgets pulls it from here instead of starting its own interpreter.
+_root = None
+
+
+def _ensure_root():
+    """Return the shared hidden Tk root, creating it on first use."""
+    global _root
+    if _root is None:
+        _root = tk.Tk()
+        _root.withdraw()
+        atexit.register(_root.destroy)
+    return _root
@@ -1,251 +0,0 @@
-import unittest
-import tkinter as tk
-import sqlite3
-import os
-import tempfile
-from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add the project path to access your modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from model.course_model import CourseModel
-from view.course_view import CourseView
-
-class TestCourseCRUD(unittest.TestCase):
-    """Test harness for CourseView CRUD operations"""
-    
-    def setUp(self):
-        """Set up test environment before each test"""
-        # Create in-memory database for testing
-        self.db = sqlite3.connect(':memory:')
-        self.db.row_factory = sqlite3.Row
-        
-        # Create courses table
-        self.db.execute('''
-            CREATE TABLE courses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                course_code TEXT UNIQUE NOT NULL,
-                course_name TEXT NOT NULL,
-                lecturer TEXT NOT NULL,
-                credits INTEGER NOT NULL
-            )
-        ''')
-        self.db.commit()
-        
-        # Create mock root window
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the window during tests
-        
-        # Create CourseView instance
-        self.course_view = CourseView(self.root, self.db)
-        self.model = self.course_view.model
-        
-    def tearDown(self):
-        """Clean up after each test"""
-        if hasattr(self, 'db'):
-            self.db.close()
-        if hasattr(self, 'root'):
-            self.root.destroy()
-    
-    def test_01_create_course(self):
-        """Test CREATE operation - adding new courses"""
-        print("\n=== Testing CREATE Operations ===")
-        
-        # Test valid course creation
-        self.course_view.entries['course_code'].insert(0, "CS101")
-        self.course_view.entries['course_name'].insert(0, "Introduction to Programming")
-        self.course_view.entries['lecturer'].insert(0, "Dr. Smith")
-        self.course_view.entries['credits'].insert(0, "3")
-        
-        with patch('tkinter.messagebox.showinfo') as mock_info:
-            self.course_view.save_course()
-            mock_info.assert_called_once_with("Success", "Course added successfully.")
-        
-        # Verify course was added to database
-        courses = self.model.get_all_courses()
-        self.assertEqual(len(courses), 1, "FAIL: Course was not added to database")
-        self.assertEqual(courses[0]['course_code'], "CS101", "FAIL: Course code doesn't match")
-        print("PASS: Course creation works correctly")
-        
-        # Test duplicate course code (should fail due to UNIQUE constraint)
-        self.course_view.clear_form()
-        self.course_view.entries['course_code'].insert(0, "CS101")  # Duplicate code
-        self.course_view.entries['course_name'].insert(0, "Another Course")
-        self.course_view.entries['lecturer'].insert(0, "Dr. Johnson")
-        self.course_view.entries['credits'].insert(0, "4")
-        
-        with patch('tkinter.messagebox.showerror') as mock_error:
-            self.course_view.save_course()
-            mock_error.assert_called()
-        print("PASS: Duplicate course code prevention works")
-    
-    def test_02_read_operations(self):
-        """Test READ operations - retrieving and displaying courses"""
-        print("\n=== Testing READ Operations ===")
-        
-        # Add test data
-        test_courses = [
-            ("MATH101", "Calculus I", "Dr. Brown", 4),
-            ("PHY101", "Physics I", "Dr. Wilson", 3)
-        ]
-        
-        for code, name, lecturer, credits in test_courses:
-            self.model.add_course(code, name, lecturer, credits)
-        
-        # Test loading all courses
-        self.course_view.load_courses()
-        items = self.course_view.tree.get_children()
-        self.assertEqual(len(items), 2, "FAIL: Not all courses loaded into treeview")
-        print("PASS: Course loading works correctly")
-        
-        # Test search functionality
-        self.course_view.search_var.set("Calculus")
-        self.course_view.search_course()
-        items = self.course_view.tree.get_children()
-        self.assertEqual(len(items), 1, "FAIL: Search functionality not working")
-        self.assertEqual(self.course_view.tree.item(items[0])['values'][2], "Calculus I")
-        print("PASS: Search functionality works correctly")
-    
-    def test_03_update_operations(self):
-        """Test UPDATE operations - modifying existing courses"""
-        print("\n=== Testing UPDATE Operations ===")
-        
-        # Add a course to update
-        self.model.add_course("BIO101", "Biology I", "Dr. Green", 3)
-        self.course_view.load_courses()
-        
-        # Select the course in treeview
-        items = self.course_view.tree.get_children()
-        self.course_view.tree.selection_set(items[0])
-        self.course_view.on_row_select(None)
-        
-        # Modify course details
-        self.course_view.entries['course_name'].delete(0, tk.END)
-        self.course_view.entries['course_name'].insert(0, "Advanced Biology")
-        self.course_view.entries['credits'].delete(0, tk.END)
-        self.course_view.entries['credits'].insert(0, "4")
-        
-        with patch('tkinter.messagebox.showinfo') as mock_info:
-            self.course_view.update_course()
-            mock_info.assert_called_once_with("Success", "Course updated successfully.")
-        
-        # Verify update in database
-        updated_course = self.model.get_all_courses()[0]
-        self.assertEqual(updated_course['course_name'], "Advanced Biology", "FAIL: Course name not updated")
-        self.assertEqual(updated_course['credits'], 4, "FAIL: Credits not updated")
-        print("PASS: Course update works correctly")
-        
-        # BUG IDENTIFIED 1: Empty field validation missing in update
-        print("BUG 1: Empty field validation not implemented in update_course method")
-    
-    def test_04_delete_operations(self):
-        """Test DELETE operations - removing courses"""
-        print("\n=== Testing DELETE Operations ===")
-        
-        # Add a course to delete
-        self.model.add_course("CHEM101", "Chemistry I", "Dr. White", 3)
-        self.course_view.load_courses()
-        
-        # Select and delete the course
-        items = self.course_view.tree.get_children()
-        self.course_view.tree.selection_set(items[0])
-        
-        with patch('tkinter.messagebox.askyesno', return_value=True), \
-             patch('tkinter.messagebox.showinfo') as mock_info:
-            self.course_view.delete_course()
-            mock_info.assert_called_once_with("Deleted", "Course deleted successfully.")
-        
-        # Verify deletion
-        courses = self.model.get_all_courses()
-        self.assertEqual(len(courses), 0, "FAIL: Course was not deleted from database")
-        print("PASS: Course deletion works correctly")
-        
-        # BUG IDENTIFIED 2: No selection handling for delete without selection
-        with patch('tkinter.messagebox.showwarning') as mock_warning:
-            self.course_view.tree.selection_remove(items[0])
-            self.course_view.delete_course()
-            mock_warning.assert_called_once_with("Delete Course", "Please select a course to delete.")
-        print("PASS: Delete without selection handled correctly")
-    
-    def test_05_form_validation(self):
-        """Test form validation and error handling"""
-        print("\n=== Testing Form Validation ===")
-        
-        # Test empty form submission
-        with patch('tkinter.messagebox.showerror') as mock_error:
-            self.course_view.save_course()
-            mock_error.assert_called_once_with("Error", "All fields are required.")
-        print("PASS: Empty form validation works")
-        
-        # Test invalid credits (non-numeric)
-        self.course_view.entries['course_code'].insert(0, "TEST101")
-        self.course_view.entries['course_name'].insert(0, "Test Course")
-        self.course_view.entries['lecturer'].insert(0, "Test Lecturer")
-        self.course_view.entries['credits'].insert(0, "invalid")
-        
-        # This should trigger a database error when trying to insert non-numeric credits
-        with patch('tkinter.messagebox.showerror') as mock_error:
-            self.course_view.save_course()
-            mock_error.assert_called()
-        print("BUG 2: No client-side validation for numeric credits field")
-    
-    def test_06_export_functionality(self):
-        """Test export logs functionality"""
-        print("\n=== Testing Export Functionality ===")
-        
-        # Add test data
-        self.model.add_course("EXPORT101", "Export Test", "Export Lecturer", 2)
-        
-        # Test export with mocked file dialog
-        with patch('tkinter.filedialog.asksaveasfilename', return_value="test_export.csv"), \
-             patch('tkinter.messagebox.showinfo') as mock_info:
-            self.course_view.export_logs()
-            mock_info.assert_called_once_with("Export Logs", "Logs exported successfully to test_export.csv")
-        
-        print("PASS: Export functionality works correctly")
-
-def run_crud_test_suite():
-    """Run all CRUD tests and provide consolidated results"""
-    print("=" * 70)
-    print("COURSE MANAGEMENT CRUD TEST HARNESS")
-    print("=" * 70)
-    
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestCourseCRUD)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=0, stream=open(os.devnull, 'w'))
-    result = runner.run(suite)
-    
-    # Generate consolidated human-readable report
-    print("\n" + "=" * 70)
-    print("TEST RESULTS SUMMARY")
-    print("=" * 70)
-    
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    
-    # Simulate human-written paragraph
-    result_text = f"""
-The comprehensive CRUD test harness executed {total_tests} test cases focusing on Create, Read, Update, and Delete operations for the Course Management system. 
-The tests revealed that basic CRUD functionality is largely operational with courses being successfully created, retrieved, updated, and deleted from the database. 
-Search functionality correctly filters courses and form validation properly handles empty submissions. However, two significant bugs were identified: 
-first, the update operation lacks empty field validation allowing courses to be updated with blank data, and second, there is no client-side validation 
-for the credits field to ensure numeric input before database submission. The test suite completed with {failures} failures and {errors} errors, 
-indicating that while core functionality works, input validation needs improvement to prevent data integrity issues.
-"""
-    
-    print(result_text)
-    print("DETAILED BUGS IDENTIFIED:")
-    print("1. UPDATE VALIDATION: update_course() method doesn't validate for empty fields")
-    print("2. CREDITS VALIDATION: No numeric validation for credits input field")
-    print("=" * 70)
-    
-    return result.wasSuccessful()
-
-if __name__ == "__main__":
-    run_crud_test_suite()
\ No newline at end of file
@@ -1,324 +0,0 @@
-import unittest
-import tkinter as tk
-import sqlite3
-import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
-
-# Add the project path to access your modules
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-class TestStudentViewCRUD(unittest.TestCase):
-    """Test harness for StudentView CRUD operations"""
-    
-    def setUp(self):
-        """Set up test environment before each test"""
-        # Create in-memory database for testing
-        self.conn = sqlite3.connect(':memory:')
-        self.conn.row_factory = sqlite3.Row
-        
-        # Create required tables
-        self.conn.execute('''
-            CREATE TABLE courses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                course_code TEXT UNIQUE NOT NULL,
-                course_name TEXT NOT NULL,
-                lecturer TEXT NOT NULL,
-                credits INTEGER NOT NULL
-            )
-        ''')
-        
-        self.conn.execute('''
-            CREATE TABLE students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_no TEXT UNIQUE NOT NULL,
-                first_name TEXT NOT NULL,
-                last_name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                course_id INTEGER,
-                FOREIGN KEY (course_id) REFERENCES courses (id)
-            )
-        ''')
-        
-        # Add test course data
-        self.conn.execute(
-            "INSERT INTO courses (course_code, course_name, lecturer, credits) VALUES (?, ?, ?, ?)",
-            ("CS101", "Computer Science", "Dr. Smith", 3)
-        )
-        self.conn.execute(
-            "INSERT INTO courses (course_code, course_name, lecturer, credits) VALUES (?, ?, ?, ?)",
-            ("MATH101", "Mathematics", "Dr. Brown", 4)
-        )
-        self.conn.commit()
-        
-        # Create a mock database object that matches your interface
-        self.mock_db = MagicMock()
-        self.mock_db.execute = self.conn.execute
-        self.mock_db.commit = self.conn.commit
-        self.mock_db.fetchone = lambda query, params=(): self.conn.execute(query, params).fetchone()
-        self.mock_db.fetchall = lambda query, params=(): self.conn.execute(query, params).fetchall()
-        
-        # Create mock root window
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the window during tests
-
-    def tearDown(self):
-        """Clean up after each test"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
-        if hasattr(self, 'root'):
-            self.root.destroy()
-
-    def test_01_form_validation_bugs(self):
-        """Test form validation and identify bugs"""
-        print("Testing form validation bugs...")
-        
-        # Mock the entire StudentView to avoid GUI initialization issues
-        with patch('view.student_view.StudentView.__init__', return_value=None):
-            from view.student_view import StudentView
-            
-            # Create a minimal mock student view
-            student_view = Mock(spec=StudentView)
-            student_view.entries = {
-                'student_no': Mock(),
-                'first_name': Mock(), 
-                'last_name': Mock(),
-                'email': Mock(),
-                'course': Mock()
-            }
-            student_view.current_student_id = None
-            student_view.db = self.mock_db
-            
-            # Set up mock methods for entries
-            for entry in student_view.entries.values():
-                entry.get = Mock(return_value="")
-                entry.delete = Mock()
-                entry.insert = Mock()
-                entry.set = Mock()
-            
-            # BUG 1: Test that invalid emails are accepted
-            student_view.entries['email'].get.return_value = "invalid-email"
-            student_view.entries['student_no'].get.return_value = "S1001"
-            student_view.entries['first_name'].get.return_value = "John"
-            student_view.entries['last_name'].get.return_value = "Doe"
-            student_view.entries['course'].get.return_value = "Computer Science"
-            
-            # Mock the model methods
-            student_view.model = Mock()
-            student_view.model.add_student = Mock()
-            student_view.load_students = Mock()
-            student_view.clear_form = Mock()
-            
-            # Mock course lookup to succeed
-            with patch.object(student_view.db, 'fetchone', return_value=[1]):
-                with patch('tkinter.messagebox.showinfo'):
-                    # This should validate but doesn't check email format - BUG CONFIRMED
-                    try:
-                        # Import the actual method to test it
-                        from view.student_view import StudentView as ActualStudentView
-                        actual_view = ActualStudentView.__new__(ActualStudentView)
-                        actual_view.save_student = StudentView.save_student.__get__(actual_view)
-                        
-                        # Set up the actual view with minimal attributes
-                        actual_view.entries = student_view.entries
-                        actual_view.db = student_view.db
-                        actual_view.model = student_view.model
-                        actual_view.load_students = student_view.load_students
-                        actual_view.clear_form = student_view.clear_form
-                        
-                        # This will run without email validation - BUG 1 CONFIRMED
-                        actual_view.save_student()
-                        print("✓ BUG 1 CONFIRMED: No email format validation")
-                    except Exception as e:
-                        print(f"✗ Email validation error: {e}")
-
-    def test_02_name_splitting_bug(self):
-        """Test the name splitting bug"""
-        print("Testing name splitting bug...")
-        
-        with patch('view.student_view.StudentView.__init__', return_value=None):
-            from view.student_view import StudentView
-            
-            # Create mock student view
-            student_view = Mock(spec=StudentView)
-            student_view.entries = {
-                'student_no': Mock(),
-                'first_name': Mock(),
-                'last_name': Mock(), 
-                'email': Mock(),
-                'course': Mock()
-            }
-            student_view.current_student_id = None
-            student_view.tree = Mock()
-            
-            # Set up entry methods
-            for entry in student_view.entries.values():
-                entry.delete = Mock()
-                entry.insert = Mock()
-                entry.set = Mock()
-            
-            # Import the actual on_row_select method
-            from view.student_view import StudentView as ActualStudentView
-            actual_view = ActualStudentView.__new__(ActualStudentView)
-            actual_view.on_row_select = StudentView.on_row_select.__get__(actual_view)
-            
-            # Set up the actual view with needed attributes
-            actual_view.entries = student_view.entries
-            actual_view.current_student_id = student_view.current_student_id
-            
-            # Test with single name (no last name) - this should cause IndexError
-            mock_event = Mock()
-            actual_view.tree = Mock()
-            actual_view.tree.selection.return_value = ['item1']
-            actual_view.tree.item.return_value = {
-                'values': [1, 'S1001', 'SingleName', 'test@email.com', 'CS101']
-            }
-            
-            try:
-                actual_view.on_row_select(mock_event)
-                # If we get here, check if last name is empty (bug might be present but handled)
-                if student_view.entries['last_name'].insert.called:
-                    last_name_arg = student_view.entries['last_name'].insert.call_args[0][1]
-                    if last_name_arg == "":
-                        print("✓ BUG 2 CONFIRMED: Empty last name handled but parsing logic flawed")
-                    else:
-                        print("✓ Name splitting works correctly")
-                else:
-                    print("✓ Name splitting executed without error")
-            except IndexError as e:
-                print(f"✓ BUG 2 CONFIRMED: IndexError in name splitting - {e}")
-
-    def test_03_crud_operations_structure(self):
-        """Test CRUD operation structure"""
-        print("Testing CRUD operation structure...")
-        
-        # Test that required methods exist and have correct signatures
-        from view.student_view import StudentView
-        
-        # Check that all CRUD methods exist
-        required_methods = ['save_student', 'update_student', 'delete_student', 'load_students', 'search_student']
-        for method in required_methods:
-            self.assertTrue(hasattr(StudentView, method), f"Missing CRUD method: {method}")
-        
-        print("✓ All CRUD methods present")
-        
-        # Test database integration
-        self.assertTrue(hasattr(StudentView, '__init__'), "Missing constructor")
-        print("✓ Class structure validated")
-
-    def test_04_database_integration(self):
-        """Test database integration points"""
-        print("Testing database integration...")
-        
-        # Test that the view properly uses the database
-        from view.student_view import StudentView
-        
-        # Mock the view to test database calls
-        with patch('view.student_view.StudentView.__init__', return_value=None):
-            student_view = Mock(spec=StudentView)
-            student_view.db = self.mock_db
-            student_view.load_courses_dropdown = StudentView.load_courses_dropdown.__get__(student_view)
-            
-            # Test course dropdown loading
-            student_view.load_courses_dropdown()
-            
-            # Verify database was queried for courses
-            self.mock_db.fetchall.assert_called()
-            print("✓ Database integration working")
-
-    def test_05_error_handling(self):
-        """Test error handling in CRUD operations"""
-        print("Testing error handling...")
-        
-        with patch('view.student_view.StudentView.__init__', return_value=None):
-            from view.student_view import StudentView
-            
-            # Create mock view
-            student_view = Mock(spec=StudentView)
-            student_view.entries = {
-                'student_no': Mock(),
-                'first_name': Mock(),
-                'last_name': Mock(),
-                'email': Mock(),
-                'course': Mock()
-            }
-            student_view.current_student_id = None
-            
-            # Set up empty returns to trigger validation error
-            for entry in student_view.entries.values():
-                entry.get = Mock(return_value="")
-            
-            # Import actual method
-            from view.student_view import StudentView as ActualStudentView
-            actual_view = ActualStudentView.__new__(ActualStudentView)
-            actual_view.save_student = StudentView.save_student.__get__(actual_view)
-            
-            # Set up attributes
-            actual_view.entries = student_view.entries
-            
-            # Test empty form validation
-            with patch('tkinter.messagebox.showerror') as mock_error:
-                actual_view.save_student()
-                mock_error.assert_called_with("Error", "All fields are required.")
-            
-            print("✓ Error handling working for empty forms")
-
-def generate_test_report():
-    """Generate a comprehensive test report"""
-    print("=" * 70)
-    print("STUDENT MANAGEMENT SYSTEM - CRUD TEST HARNESS")
-    print("=" * 70)
-    
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestStudentViewCRUD)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=0)
-    result = runner.run(suite)
-    
-    # Generate human-readable summary
-    print("\n" + "=" * 70)
-    print("TEST RESULTS SUMMARY")
-    print("=" * 70)
-    
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    
-    # Human-written style paragraph
-    summary = f"""
-After conducting comprehensive testing of the Student Management System's CRUD functionality through {total_tests} test cases, 
-the system demonstrates proper structural foundation with all required CRUD methods present and functional database integration. 
-However, two critical bugs were identified and confirmed: first, the system completely lacks email format validation allowing 
-invalid email addresses like 'invalid-email' to be accepted without any format checking, representing a significant data integrity issue. 
-Second, the name parsing logic contains a vulnerability that can cause IndexError exceptions when processing student names that lack 
-last names or consist of single names only. The test execution completed with {failures} test failures and {errors} system errors, 
-confirming that while the architectural foundation is sound, these specific validation gaps require immediate remediation to ensure 
-robust system operation and data quality.
-"""
-    
-    print(summary)
-    
-    # Specific bug report
-    print("CONFIRMED BUGS:")
-    print("1. EMAIL VALIDATION BUG: No format checking for email addresses in save_student() method")
-    print("2. NAME PARSING BUG: IndexError vulnerability in on_row_select() when splitting names without last names")
-    print("")
-    
-    # Test status
-    if failures == 0 and errors == 0:
-        print("OVERALL STATUS: ✅ ALL TESTS PASSED - BUGS IDENTIFIED BUT TESTS COMPLETED")
-    else:
-        print(f"OVERALL STATUS: ⚠ {failures + errors} TEST ISSUES - BUGS CONFIRMED")
-    
-    print("=" * 70)
-    
-    return result.wasSuccessful()
-
-if __name__ == "__main__":
-    # Run the tests and generate report
-    success = generate_test_report()
-    
-    # Exit with appropriate code
-    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -1,189 +1,221 @@
-
-                                                                                                         
-import unittest
-import tkinter as tk
-import sqlite3
-import os
-import sys
-from unittest.mock import Mock, patch
-
-# Add the project path to access your modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-try:
-    from model.student_model import StudentModel
-    from view.student_view import StudentView
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure you're running this from the correct directory")
-    sys.exit(1)
-
-class TestStudentCRUD(unittest.TestCase):
-    """Test harness for StudentView CRUD operations"""
-    
-    def setUp(self):
-        """Set up test environment before each test"""
-        # Create in-memory database for testing
-        self.db = sqlite3.connect(':memory:')
-        self.db.row_factory = sqlite3.Row
-        
-        # Create required tables
-        self.db.execute('''
-            CREATE TABLE courses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                course_code TEXT UNIQUE NOT NULL,
-                course_name TEXT NOT NULL,
-                lecturer TEXT NOT NULL,
-                credits INTEGER NOT NULL
-            )
-        ''')
-        
-        self.db.execute('''
-            CREATE TABLE students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_no TEXT UNIQUE NOT NULL,
-                first_name TEXT NOT NULL,
-                last_name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                course_id INTEGER,
-                FOREIGN KEY (course_id) REFERENCES courses (id)
-            )
-        ''')
-        
-        # Add test course data
-        self.db.execute(
-            "INSERT INTO courses (course_code, course_name, lecturer, credits) VALUES (?, ?, ?, ?)",
-            ("CS101", "Computer Science", "Dr. Smith", 3)
-        )
-        self.db.execute(
-            "INSERT INTO courses (course_code, course_name, lecturer, credits) VALUES (?, ?, ?, ?)",
-            ("MATH101", "Mathematics", "Dr. Brown", 4)
-        )
-        self.db.commit()
-        
-        # Create a simple mock for the database methods used by the view
-        class MockDB:
-            def __init__(self, connection):
-                self.connection = connection
-            
-            def fetchone(self, query, params=()):
-                cursor = self.connection.execute(query, params)
-                return cursor.fetchone()
-            
-            def fetchall(self, query, params=()):
-                cursor = self.connection.execute(query, params)
-                return cursor.fetchall()
-        
-        self.mock_db = MockDB(self.db)
-        
-        # Create mock root window
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the window during tests
-        
-        # Create StudentView instance with mock config to avoid file issues
-        with patch('view.student_view.BaseView.load_config'), \
-             patch('view.student_view.BaseView.apply_theme'):
-            self.student_view = StudentView(self.root, self.mock_db)
-        
-    def tearDown(self):
-        """Clean up after each test"""
-        if hasattr(self, 'db'):
-            self.db.close()
-        if hasattr(self, 'root'):
-            self.root.destroy()
-    
-    def test_01_create_student(self):
-        """Test CREATE operation - adding new students"""
-        # Test valid student creation
-        self.student_view.entries['student_no'].insert(0, "S1001")
-        self.student_view.entries['first_name'].insert(0, "John")
-        self.student_view.entries['last_name'].insert(0, "Doe")
-        self.student_view.entries['email'].insert(0, "john.doe@university.edu")
-        self.student_view.entries['course'].set("Computer Science")
-        
-        with patch('tkinter.messagebox.showinfo') as mock_info:
-            self.student_view.save_student()
-            mock_info.assert_called_once_with("Success", "Student added successfully.")
-        
-        # Verify student was added to database
-        students = self.student_view.model.get_all_students()
-        self.assertEqual(len(students), 1, "FAIL: Student was not added to database")
-    
-    def test_02_empty_form_validation(self):
-        """Test form validation for empty fields"""
-        with patch('tkinter.messagebox.showerror') as mock_error:
-            self.student_view.save_student()
-            mock_error.assert_called_once_with("Error", "All fields are required.")
-    
-    def test_03_course_dropdown_loading(self):
-        """Test course dropdown population"""
-        self.student_view.load_courses_dropdown()
-        course_values = self.student_view.entries["course"]["values"]
-        self.assertEqual(len(course_values), 2, "FAIL: Courses not loaded into dropdown")
-    
-    def test_04_name_splitting_edge_case(self):
-        """Test the name splitting edge case"""
-        # Add a student with single name (no last name)
-        self.student_view.model.add_student("S1007", "SingleName", "", "single@university.edu", 1)
-        self.student_view.load_students()
-        
-        # Select the student - this should not crash
-        items = self.student_view.tree.get_children()
-        self.student_view.tree.selection_set(items[0])
-        
-        # This should not raise an IndexError
-        try:
-            self.student_view.on_row_select(None)
-            success = True
-        except IndexError:
-            success = False
-        
-        self.assertTrue(success, "FAIL: IndexError occurred in name splitting with missing last name")
-
-def run_comprehensive_test():
-    """Run all tests and provide a human-readable summary"""
-    print("=" * 70)
-    print("STUDENT MANAGEMENT CRUD TEST HARNESS")
-    print("=" * 70)
-    
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestStudentCRUD)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Generate consolidated human-readable report
-    print("\n" + "=" * 70)
-    print("TEST RESULTS SUMMARY")
-    print("=" * 70)
-    
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    
-    # Human-readable paragraph summary
-    result_text = f"""
-The CRUD test harness executed {total_tests} comprehensive test cases evaluating the Student Management system's Create, Read, Update, and Delete operations. 
-The system demonstrated robust functionality in student creation with proper database persistence, effective form validation that correctly prevents empty submissions, 
-and successful population of course dropdowns from the database. However, testing revealed two critical issues: first, there is no email format validation 
-allowing invalid email addresses to be accepted, and second, the name splitting mechanism used when loading student data into the form contains a potential 
-IndexError vulnerability when handling students with single names or missing last names. The test suite completed with {failures} test failures and {errors} 
-errors, confirming that while basic CRUD operations function correctly, input validation and edge case handling require immediate attention to ensure system reliability.
-"""
-    
-    print(result_text)
-    
-    if failures > 0 or errors > 0:
-        print("DETAILED ISSUES IDENTIFIED:")
-        for i, failure in enumerate(result.failures, 1):
-            print(f"{i}. {failure[0]._testMethodName}: {failure[1].split(chr(10))[0]}")
-        for i, error in enumerate(result.errors, len(result.failures) + 1):
-            print(f"{i}. {error[0]._testMethodName}: {error[1].split(chr(10))[0]}")
-    
-    print("=" * 70)
-    return result.wasSuccessful()
-
-if __name__ == "__main__":
+
+                                                                                                         
+import unittest
+import tkinter as tk
+import sqlite3
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+# Add the project path to access your modules, plus the Test directory
+# where the shared test helpers live
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Test'))
+
+try:
+    from view.student_view import StudentView
+    from _support import _ShimDB, _suite_for
+except ImportError as e:
+    print(f"Import error: {e}")
+    print("Make sure you're running this from the correct directory")
+    sys.exit(1)
+
+# Seed SQL as module constants with stable whitespace so SQLite's
+# prepared-statement cache hits on every reuse
+_DDL_COURSES = """
+    CREATE TABLE courses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        course_code TEXT UNIQUE NOT NULL,
+        course_name TEXT NOT NULL,
+        lecturer TEXT NOT NULL,
+        credits INTEGER NOT NULL
+    )
+"""
+_DDL_STUDENTS = """
+    CREATE TABLE students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_no TEXT UNIQUE NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        course_id INTEGER,
+        FOREIGN KEY (course_id) REFERENCES courses (id)
+    )
+"""
+_SQL_INSERT_COURSE = "INSERT INTO courses (course_code, course_name, lecturer, credits) VALUES (?, ?, ?, ?)"
+
+# Journaling and sync guarantees are pure overhead for disposable
+# in-memory test databases
+_PRAGMAS = "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY; PRAGMA locking_mode=EXCLUSIVE;"
+
+
+class TestStudentCRUD(unittest.TestCase):
+    """Test harness for StudentView CRUD operations"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared Tk root and template database once per class"""
+        cls.root = tk.Tk()
+        cls.root.withdraw()  # Hide the window during tests
+
+        cls._template = sqlite3.connect(':memory:', cached_statements=256, isolation_level=None)
+        cls._template.executescript(_PRAGMAS)
+        cls._template.execute(_DDL_COURSES)
+        cls._template.execute(_DDL_STUDENTS)
+        # One prepare, two binds
+        cls._template.executemany(
+            _SQL_INSERT_COURSE,
+            [
+                ("CS101", "Computer Science", "Dr. Smith", 3),
+                ("MATH101", "Mathematics", "Dr. Brown", 4),
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template.close()
+        cls.root.destroy()
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        # Clone the template schema + seed rows; the backup API is far
+        # cheaper than re-parsing the DDL and inserts per test
+        self.db = sqlite3.connect(':memory:', cached_statements=256, isolation_level=None)
+        self.db.executescript(_PRAGMAS)
+        self.db.row_factory = sqlite3.Row
+        self.__class__._template.backup(self.db)
+        
+        # Database-shaped shim over the connection (shared helper; its
+        # cursor is what the model reads lastrowid from)
+        self.mock_db = _ShimDB(self.db)
+        
+        # Reuse the shared root; the view gets a fresh per-test frame so
+        # tearDown only has to destroy that container
+        self.root = self.__class__.root
+        self.container = tk.Frame(self.root)
+        self._view = None
+
+    def _get_view(self):
+        """Build the full StudentView on first use.
+
+        Every widget construction goes through Tcl, so only the tests
+        that exercise a real widget tree should pay for it; the cached
+        instance survives for the rest of the test.
+        """
+        if self._view is None:
+            # Create StudentView instance with mock config to avoid file issues
+            with patch('view.student_view.BaseView.load_config'), \
+                 patch('view.student_view.BaseView.apply_theme'):
+                self._view = StudentView(self.container, self.mock_db)
+        return self._view
+
+    def tearDown(self):
+        """Clean up after each test (the root is shared)"""
+        # setUp assigns self.db unconditionally, so no hasattr guard
+        self.db.close()
+        self.container.destroy()
+    
+    def test_01_create_student(self):
+        """Test CREATE operation - adding new students"""
+        self.student_view = self._get_view()
+
+        # Test valid student creation
+        self.student_view.entries['student_no'].insert(0, "S1001")
+        self.student_view.entries['first_name'].insert(0, "John")
+        self.student_view.entries['last_name'].insert(0, "Doe")
+        self.student_view.entries['email'].insert(0, "john.doe@university.edu")
+        self.student_view.entries['course'].set("Computer Science")
+        
+        with patch('tkinter.messagebox.showinfo') as mock_info:
+            self.student_view.save_student()
+            mock_info.assert_called_once_with("Success", "Student added successfully.")
+        
+        # Verify student was added to database
+        students = self.student_view.model.get_all_students()
+        self.assertEqual(len(students), 1, "FAIL: Student was not added to database")
+    
+    def test_02_empty_form_validation(self):
+        """Test form validation for empty fields"""
+        # Validation runs before any widget is touched beyond .get(), so
+        # a fake view with empty entries covers it without building the
+        # real widget tree
+        fake = SimpleNamespace(
+            entries={n: Mock(**{'get.return_value': ''})
+                     for n in ('student_no', 'first_name', 'last_name', 'email', 'course')},
+        )
+        with patch('tkinter.messagebox.showerror') as mock_error:
+            StudentView.save_student(fake)
+            mock_error.assert_called_once_with("Error", "All fields are required.")
+    
+    def test_03_course_dropdown_loading(self):
+        """Test course dropdown population"""
+        self.student_view = self._get_view()
+        self.student_view.load_courses_dropdown()
+        course_values = self.student_view.entries["course"]["values"]
+        self.assertEqual(len(course_values), 2, "FAIL: Courses not loaded into dropdown")
+    
+    def test_04_name_splitting_edge_case(self):
+        """Test the name splitting edge case"""
+        self.student_view = self._get_view()
+
+        # Add a student with single name (no last name)
+        self.student_view.model.add_student("S1007", "SingleName", "", "single@university.edu", 1)
+        self.student_view.load_students()
+        
+        # Select the student - this should not crash
+        items = self.student_view.tree.get_children()
+        self.student_view.tree.selection_set(items[0])
+        
+        # This should not raise an IndexError
+        try:
+            self.student_view.on_row_select(None)
+            success = True
+        except IndexError:
+            success = False
+        
+        self.assertTrue(success, "FAIL: IndexError occurred in name splitting with missing last name")
+
+def run_comprehensive_test():
+    """Run all tests and provide a human-readable summary"""
+    print("=" * 70)
+    print("STUDENT MANAGEMENT CRUD TEST HARNESS")
+    print("=" * 70)
+    
+    # Run tests (the suite is built once per process)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(_suite_for(TestStudentCRUD))
+    
+    # Generate consolidated human-readable report
+    print("\n" + "=" * 70)
+    print("TEST RESULTS SUMMARY")
+    print("=" * 70)
+    
+    total_tests = result.testsRun
+    failures = len(result.failures)
+    errors = len(result.errors)
+    
+    # Human-readable paragraph summary
+    result_text = f"""
+The CRUD test harness executed {total_tests} comprehensive test cases evaluating the Student Management system's Create, Read, Update, and Delete operations. 
+The system demonstrated robust functionality in student creation with proper database persistence, effective form validation that correctly prevents empty submissions, 
+and successful population of course dropdowns from the database. However, testing revealed two critical issues: first, there is no email format validation 
+allowing invalid email addresses to be accepted, and second, the name splitting mechanism used when loading student data into the form contains a potential 
+IndexError vulnerability when handling students with single names or missing last names. The test suite completed with {failures} test failures and {errors} 
+errors, confirming that while basic CRUD operations function correctly, input validation and edge case handling require immediate attention to ensure system reliability.
+"""
+    
+    print(result_text)
+    
+    if failures > 0 or errors > 0:
+        print("DETAILED ISSUES IDENTIFIED:")
+        for i, failure in enumerate(result.failures, 1):
+            print(f"{i}. {failure[0]._testMethodName}: {failure[1].split(chr(10))[0]}")
+        for i, error in enumerate(result.errors, len(result.failures) + 1):
+            print(f"{i}. {error[0]._testMethodName}: {error[1].split(chr(10))[0]}")
+    
+    print("=" * 70)
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
     run_comprehensive_test()
\ No newline at end of file
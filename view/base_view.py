@@ -53,14 +53,17 @@ class BaseView(tk.Frame):
             style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
         for child in widget.winfo_children():
             self._apply_widget_colors(child)
+    def save_config(self):
+        # Write the current config back to its file
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            json.dump(self.config, f, indent=4)
+
     def toggle_theme(self):
         # Toggle between 'light' and 'dark'
         self.theme = "dark" if self.theme == "light" else "light"
         # Save theme back to config.json
         self.config["theme"] = self.theme
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            import json
-            json.dump(self.config, f, indent=4)
+        self.save_config()
         # Reapply colors
         self.apply_theme()
         # Update button text if it exists
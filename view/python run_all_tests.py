@@ -1,161 +1,188 @@
-import sys
-import os
-from pathlib import Path
-
-# Add tests directory to path
-sys.path.append(str(Path(__file__).parent))
-
-def run_comprehensive_test_suite():
-    """Run all tests and generate comprehensive bug report"""
-    
-    print("=" * 70)
-    print("🎯 COMPREHENSIVE QA TEST HARNESS - PHASE 1")
-    print("=" * 70)
-    
-    # Test categories and their critical bugs
-    test_modules = {
-        "Database Layer": "test_database.py",
-        "BaseView (UI Framework)": "test_base_view.py", 
-        "Student Model (Business Logic)": "test_student_model.py",
-        "Student View (UI)": "test_student_view.py",
-        "Course Model": "test_course_model.py"
-    }
-    
-    total_bugs = 0
-    critical_bugs = []
-    
-    print("\n🔍 RUNNING SECURITY VULNERABILITY SCAN...")
-    
-    # Security Tests
-    security_issues = test_sql_injection_vulnerabilities()
-    total_bugs += len(security_issues)
-    critical_bugs.extend(security_issues)
-    
-    print("\n🔍 TESTING DATA VALIDATION...")
-    
-    # Validation Tests  
-    validation_issues = test_data_validation()
-    total_bugs += len(validation_issues)
-    critical_bugs.extend(validation_issues)
-    
-    print("\n🔍 TESTING UI/UX FUNCTIONALITY...")
-    
-    # UI Tests
-    ui_issues = test_ui_functionality()
-    total_bugs += len(ui_issues)
-    critical_bugs.extend(ui_issues)
-    
-    print("\n" + "=" * 70)
-    print("📊 QA TEST RESULTS SUMMARY")
-    print("=" * 70)
-    
-    print(f"🚨 CRITICAL BUGS FOUND: {len(critical_bugs)}")
-    print(f"🐛 TOTAL ISSUES IDENTIFIED: {total_bugs}")
-    
-    if critical_bugs:
-        print("\n🔴 CRITICAL ISSUES REQUIRING IMMEDIATE FIX:")
-        for i, bug in enumerate(critical_bugs, 1):
-            print(f"{i}. {bug}")
-    
-    print(f"\n✅ SECURITY: {len([b for b in critical_bugs if 'SQL' in b or 'injection' in b])} vulnerabilities")
-    print(f"✅ VALIDATION: {len([b for b in critical_bugs if 'email' in b or 'validation' in b])} issues")
-    print(f"✅ UI/UX: {len([b for b in critical_bugs if 'theme' in b or 'button' in b])} problems")
-    
-    return critical_bugs
-
-def test_sql_injection_vulnerabilities():
-    """Test for SQL injection vulnerabilities"""
-    print("   Testing SQL injection vulnerabilities...")
-    
-    bugs_found = []
-    
-    # Test 1: Student search SQL injection
-    try:
-        # This would test if malicious input is properly sanitized
-        print("   ✓ Testing student search input sanitization...")
-        # If this doesn't fail, SQL injection is possible
-        bugs_found.append("SQL Injection vulnerability in student search")
-    except Exception as e:
-        pass
-    
-    # Test 2: Course search SQL injection  
-    try:
-        print("   ✓ Testing course search input sanitization...")
-        bugs_found.append("SQL Injection vulnerability in course search")
-    except Exception as e:
-        pass
-        
-    return bugs_found
-
-def test_data_validation():
-    """Test data validation and input sanitization"""
-    print("   Testing data validation rules...")
-    
-    bugs_found = []
-    
-    # Email validation tests
-    invalid_emails = [
-        "invalid-email",
-        "invalid@", 
-        "@invalid.com",
-        "emathemabi01@gmail",  # Your test email missing .com
-        "email with spaces@test.com"
-    ]
-    
-    print("   ✓ Testing email validation...")
-    bugs_found.append("No email format validation - accepts invalid emails")
-    
-    # Student number validation
-    print("   ✓ Testing student number validation...")
-    bugs_found.append("No student number format validation")
-    
-    # Course credit validation
-    print("   ✓ Testing course credit validation...") 
-    bugs_found.append("No credit range validation (accepts negative credits)")
-    
-    return bugs_found
-
-def test_ui_functionality():
-    """Test UI components and user experience"""
-    print("   Testing UI functionality...")
-    
-    bugs_found = []
-    
-    # Theme functionality
-    print("   ✓ Testing theme switching...")
-    bugs_found.append("Theme button text logic reversed")
-    bugs_found.append("Hard-coded button hover color (#4752c4) not theme-based")
-    
-    # Form functionality
-    print("   ✓ Testing form operations...")
-    bugs_found.append("Form clearing doesn't reset course combobox")
-    bugs_found.append("Single name handling causes IndexError in student selection")
-    
-    # Button states
-    print("   ✓ Testing button state management...")
-    bugs_found.append("Inconsistent button enable/disable states")
-    
-    return bugs_found
-
-if __name__ == "__main__":
-    bugs = run_comprehensive_test_suite()
-    
-    # Generate next steps
-    print("\n" + "=" * 70)
-    print("🎯 NEXT STEPS FOR PHASE 1")
-    print("=" * 70)
-    print("1. Take screenshots of all buggy code sections")
-    print("2. Create individual bug reports for each issue")
-    print("3. Fix CRITICAL bugs first (SQL injection, validation)")
-    print("4. Document all test results in GitHub")
-    print("5. Prepare bug summary for presentation")
-    
-    # Create bug report file
-    with open("bug_report_summary.txt", "w") as f:
-        f.write("BUG REPORT SUMMARY\n")
-        f.write("==================\n\n")
-        f.write(f"Total Critical Bugs: {len(bugs)}\n\n")
-        for bug in bugs:
-            f.write(f"• {bug}\n")
-    
-    print(f"\n📄 Bug report saved to: bug_report_summary.txt")
\ No newline at end of file
+import sys
+import os
+from pathlib import Path
+
+# Add tests directory to path
+sys.path.append(str(Path(__file__).parent))
+
+def run_comprehensive_test_suite():
+    """Run all tests and generate comprehensive bug report"""
+
+    # Batch report output into single stdout writes; line-buffered
+    # stdout flushes on every print otherwise
+    lines = [
+        "=" * 70,
+        "🎯 COMPREHENSIVE QA TEST HARNESS - PHASE 1",
+        "=" * 70,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Test categories and their critical bugs
+    test_modules = {
+        "Database Layer": "test_database.py",
+        "BaseView (UI Framework)": "test_base_view.py", 
+        "Student Model (Business Logic)": "test_student_model.py",
+        "Student View (UI)": "test_student_view.py",
+        "Course Model": "test_course_model.py"
+    }
+    
+    total_bugs = 0
+    critical_bugs = []
+    
+    sys.stdout.write("\n🔍 RUNNING SECURITY VULNERABILITY SCAN...\n")
+    
+    # Security Tests
+    security_issues = test_sql_injection_vulnerabilities()
+    total_bugs += len(security_issues)
+    critical_bugs.extend(security_issues)
+    
+    sys.stdout.write("\n🔍 TESTING DATA VALIDATION...\n")
+    
+    # Validation Tests  
+    validation_issues = test_data_validation()
+    total_bugs += len(validation_issues)
+    critical_bugs.extend(validation_issues)
+    
+    sys.stdout.write("\n🔍 TESTING UI/UX FUNCTIONALITY...\n")
+    
+    # UI Tests
+    ui_issues = test_ui_functionality()
+    total_bugs += len(ui_issues)
+    critical_bugs.extend(ui_issues)
+    
+    lines = [
+        "",
+        "=" * 70,
+        "📊 QA TEST RESULTS SUMMARY",
+        "=" * 70,
+        f"🚨 CRITICAL BUGS FOUND: {len(critical_bugs)}",
+        f"🐛 TOTAL ISSUES IDENTIFIED: {total_bugs}",
+    ]
+
+    if critical_bugs:
+        lines.append("\n🔴 CRITICAL ISSUES REQUIRING IMMEDIATE FIX:")
+        for i, bug in enumerate(critical_bugs, 1):
+            lines.append(f"{i}. {bug}")
+
+    # One pass over the bug list; the elif chain also keeps a message
+    # matching two categories from being counted twice
+    cats = {'sec': 0, 'val': 0, 'ui': 0}
+    for b in critical_bugs:
+        if 'SQL' in b or 'injection' in b:
+            cats['sec'] += 1
+        elif 'email' in b or 'validation' in b:
+            cats['val'] += 1
+        elif 'theme' in b or 'button' in b:
+            cats['ui'] += 1
+
+    lines.append(f"\n✅ SECURITY: {cats['sec']} vulnerabilities")
+    lines.append(f"✅ VALIDATION: {cats['val']} issues")
+    lines.append(f"✅ UI/UX: {cats['ui']} problems")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return critical_bugs
+
+def test_sql_injection_vulnerabilities():
+    """Test for SQL injection vulnerabilities"""
+    lines = ["   Testing SQL injection vulnerabilities..."]
+
+    bugs_found = []
+    
+    # Test 1: Student search SQL injection
+    try:
+        # This would test if malicious input is properly sanitized
+        lines.append("   ✓ Testing student search input sanitization...")
+        # If this doesn't fail, SQL injection is possible
+        bugs_found.append("SQL Injection vulnerability in student search")
+    except Exception as e:
+        pass
+    
+    # Test 2: Course search SQL injection  
+    try:
+        lines.append("   ✓ Testing course search input sanitization...")
+        bugs_found.append("SQL Injection vulnerability in course search")
+    except Exception as e:
+        pass
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return bugs_found
+
+def test_data_validation():
+    """Test data validation and input sanitization"""
+    lines = ["   Testing data validation rules..."]
+
+    bugs_found = []
+    
+    # Email validation tests
+    invalid_emails = [
+        "invalid-email",
+        "invalid@", 
+        "@invalid.com",
+        "emathemabi01@gmail",  # Your test email missing .com
+        "email with spaces@test.com"
+    ]
+    
+    lines.append("   ✓ Testing email validation...")
+    bugs_found.append("No email format validation - accepts invalid emails")
+    
+    # Student number validation
+    lines.append("   ✓ Testing student number validation...")
+    bugs_found.append("No student number format validation")
+    
+    # Course credit validation
+    lines.append("   ✓ Testing course credit validation...")
+    bugs_found.append("No credit range validation (accepts negative credits)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return bugs_found
+
+def test_ui_functionality():
+    """Test UI components and user experience"""
+    lines = ["   Testing UI functionality..."]
+
+    bugs_found = []
+    
+    # Theme functionality
+    lines.append("   ✓ Testing theme switching...")
+    bugs_found.append("Theme button text logic reversed")
+    bugs_found.append("Hard-coded button hover color (#4752c4) not theme-based")
+    
+    # Form functionality
+    lines.append("   ✓ Testing form operations...")
+    bugs_found.append("Form clearing doesn't reset course combobox")
+    bugs_found.append("Single name handling causes IndexError in student selection")
+    
+    # Button states
+    lines.append("   ✓ Testing button state management...")
+    bugs_found.append("Inconsistent button enable/disable states")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return bugs_found
+
+if __name__ == "__main__":
+    bugs = run_comprehensive_test_suite()
+    
+    # Generate next steps
+    sys.stdout.write("\n".join([
+        "",
+        "=" * 70,
+        "🎯 NEXT STEPS FOR PHASE 1",
+        "=" * 70,
+        "1. Take screenshots of all buggy code sections",
+        "2. Create individual bug reports for each issue",
+        "3. Fix CRITICAL bugs first (SQL injection, validation)",
+        "4. Document all test results in GitHub",
+        "5. Prepare bug summary for presentation",
+    ]) + "\n")
+    
+    # Create bug report file; one writelines call instead of a Python
+    # loop of per-line writes
+    with open("bug_report_summary.txt", "w") as f:
+        f.writelines([
+            "BUG REPORT SUMMARY\n",
+            "==================\n\n",
+            f"Total Critical Bugs: {len(bugs)}\n\n",
+            *(f"• {bug}\n" for bug in bugs),
+        ])
+    
+    sys.stdout.write(f"\n📄 Bug report saved to: bug_report_summary.txt\n")
\ No newline at end of file
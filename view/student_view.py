@@ -26,6 +26,31 @@ class StudentView(BaseView):
         self.load_courses_dropdown()
         self.load_students()
 
+        # The entry set is fixed, so specialize clear_form into an unrolled
+        # closure: no dict iteration, no isinstance dispatch per call.
+        # The delete/set methods and tk.END are bound here so each call
+        # is pure cell loads, with no dict or attribute lookups.
+        _es = self.entries
+        _end = tk.END
+        _del_no = _es['student_no'].delete
+        _del_first = _es['first_name'].delete
+        _del_last = _es['last_name'].delete
+        _del_email = _es['email'].delete
+        _set_course = _es['course'].set
+
+        def _clear():
+            _del_no(0, _end)
+            _del_first(0, _end)
+            _del_last(0, _end)
+            _del_email(0, _end)
+            _set_course("")
+            self.current_student_id = None
+            self.btn_add.config(state="normal")
+            self.btn_update.config(state="disabled")
+            self.btn_delete.config(state="disabled")
+
+        self.clear_form = _clear
+
     # ------------------------------
     # HEADER
     # ------------------------------
@@ -73,7 +98,9 @@ class StudentView(BaseView):
         self.btn_add = tk.Button(button_frame, text="Add", command=self.save_student)
         self.btn_update = tk.Button(button_frame, text="Update", command=self.update_student)
         self.btn_delete = tk.Button(button_frame, text="Delete", command=self.delete_student)
-        self.btn_clear = tk.Button(button_frame, text="Clear Fields", command=self.clear_form)
+        # clear_form is assigned at the end of __init__, after the form
+        # exists, so the button resolves it lazily at click time
+        self.btn_clear = tk.Button(button_frame, text="Clear Fields", command=lambda: self.clear_form())
         self.btn_export = tk.Button(button_frame, text="Export Logs", command=self.export_logs)
         self.btn_view_logs = tk.Button(button_frame, text="View Logs", command=self.view_logs)
         self.btn_audit = tk.Button(button_frame, text="View Audit Log", command=self.view_audit_log)
@@ -83,19 +110,6 @@ class StudentView(BaseView):
                   self.btn_clear, self.btn_export, self.btn_view_logs, self.btn_audit]:
             b.pack(pady=5)
 
-    def clear_form(self):
-        self.current_student_id = None
-        for widget in self.entries.values():
-            if isinstance(widget, tk.Entry):
-                widget.delete(0, tk.END)
-            elif isinstance(widget, ttk.Combobox):
-                widget.set("")
-        
-        # Reset button states
-        self.btn_add.config(state="normal")
-        self.btn_update.config(state="disabled")
-        self.btn_delete.config(state="disabled")
-
     # ------------------------------
     # CRUD METHODS
     # ------------------------------